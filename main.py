@@ -3,23 +3,90 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import pyperclip
 import sqlite3
+import heapq
 from datetime import datetime
 import sys
 import threading
-import traceback
-from infi.systray import SysTrayIcon
+import logging
+import os
+import ctypes
+import pystray
+from PIL import Image, ImageDraw
+
+log = logging.getLogger(__name__)
+
+# Win32 constants for registering Ctrl+F1 with RegisterHotKey
+MOD_CONTROL = 0x0002
+MOD_NOREPEAT = 0x4000
+VK_F1 = 0x70
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+HOTKEY_ID = 1
+
+DB_PATH = 'quickclip.db'
+
+# Per-connection tuning for low-latency reads and cheaper commits. WAL mode
+# itself is persistent and is switched on once in setup_database.
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+# SQL shared by the hot paths. Kept as module-level constants so the
+# same string objects are passed every time and sqlite3's statement cache
+# returns the already-prepared statement instead of re-parsing it.
+SQL_ALL = "SELECT alias, content FROM aliases ORDER BY alias"
+SQL_UPSERT = (
+    "INSERT INTO aliases (alias, content) VALUES (?, ?) "
+    "ON CONFLICT(alias) DO UPDATE SET "
+    "content = excluded.content, updated_at = CURRENT_TIMESTAMP"
+)
+SQL_CREATE_ALIASES = '''
+    CREATE TABLE IF NOT EXISTS aliases (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        alias TEXT UNIQUE NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
 
 class QuickClipManager:
     def __init__(self):
         # Initialize state variables first
         self.is_quick_window_visible = False
         self.quick_window = None
+        self.quick_entry = None
         self.suggestion_window = None
         self.root = None
         self.suggestion_listbox = None
         self.current_suggestions = []
+        # Rows currently shown in the suggestion listbox and the last applied
+        # width/height/geometry, used to update only what changed between keystrokes
+        self._last_display = []
+        self._sugg_width = None
+        self._sugg_height = None
+        self._sugg_geom = None
+        self._sugg_visible = False
+        # In-memory copy of (alias, content, lowercase alias) rows so the
+        # suggestion path never has to hit SQLite
+        self._alias_cache = []
+        # First 10 aliases in alphabetical order, shown when just '/' is typed
+        self._top10 = []
+        # Pending after() job used to debounce suggestion updates
+        self._suggest_job = None
         self.running = True
         self.tray_icon = None
+        # Screen size the quick input geometry was computed for, and the
+        # cached (width, height, x, y, geometry), see quick_input_geometry()
+        self._screen_w = None
+        self._screen_h = None
+        self._quick_geom = None
+        # Thread running the RegisterHotKey message loop on Windows
+        self._hotkey_thread_id = None
+        # Per-thread SQLite connections, see _conn()
+        self._tls = threading.local()
         
         # Then setup the application
         self.setup_database()
@@ -30,24 +97,36 @@ class QuickClipManager:
     def setup_tray(self):
         """Setup system tray icon and menu"""
         try:
-            menu_options = (
-                ("Show Window", None, self.show_window),
-                ("Exit", None, self.quit_application)
+            # Menu callbacks run on the tray thread, so hop to the Tk thread
+            menu = pystray.Menu(
+                pystray.MenuItem(
+                    "Show Window",
+                    lambda: self.root.after(0, self.show_window),
+                    default=True
+                ),
+                pystray.MenuItem("Exit", self.quit_application)
             )
             
-            self.tray_icon = SysTrayIcon(
-                None,  # Use default icon
+            self.tray_icon = pystray.Icon(
+                "qcm",
+                self.create_tray_image(),
                 "Quick Clip Manager",
-                menu_options,
-                on_quit=self.quit_application
+                menu=menu
             )
             
-            # Start the tray icon
-            self.tray_icon.start()
+            # Start the tray icon without blocking the Tk main loop
+            self.tray_icon.run_detached()
             
         except Exception as e:
-            print(f"Error setting up system tray: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error setting up system tray: %s", e)
+
+    def create_tray_image(self):
+        """Draw a small clipboard icon for the system tray"""
+        image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((12, 8, 52, 60), fill=(70, 130, 180), outline=(30, 60, 90), width=3)
+        draw.rectangle((24, 4, 40, 14), fill=(200, 200, 200), outline=(30, 60, 90), width=2)
+        return image
 
     def hide_to_tray(self):
         """Hide the main window to system tray"""
@@ -55,43 +134,53 @@ class QuickClipManager:
             self.root.withdraw()
             self.show_notification("Running in background")
         except Exception as e:
-            print(f"Error hiding to tray: {str(e)}")
+            log.error("Error hiding to tray: %s", e)
 
-    def show_window(self, systray=None):
+    def show_window(self, icon=None):
         """Show the main window from system tray"""
         try:
             self.root.deiconify()
             self.root.lift()
             self.root.focus_force()
         except Exception as e:
-            print(f"Error showing window: {str(e)}")
+            log.error("Error showing window: %s", e)
 
     def setup_database(self):
         """Initialize SQLite database and create tables if they don't exist"""
         try:
-            self.conn = sqlite3.connect('quickclip.db', check_same_thread=False)
-            self.cursor = self.conn.cursor()
-            
-            # Create aliases table
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS aliases (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    alias TEXT UNIQUE NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            self.conn.commit()
+            # Schema setup runs once on its own connection, before any thread
+            # opens a connection of its own
+            conn = sqlite3.connect(DB_PATH)
+            try:
+                # WAL lets readers run alongside the writer; the database
+                # gains quickclip.db-wal and quickclip.db-shm sidecar files
+                conn.execute('PRAGMA journal_mode=WAL')
+                # Create aliases table
+                with conn:
+                    conn.execute(SQL_CREATE_ALIASES)
+            finally:
+                conn.close()
         except Exception as e:
             messagebox.showerror("Database Error", f"Failed to setup database: {str(e)}")
             raise
 
+    def _conn(self):
+        """Return the SQLite connection owned by the calling thread"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = self._tls.conn = sqlite3.connect(
+                DB_PATH, check_same_thread=True, cached_statements=256
+            )
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+
     def setup_main_window(self):
         """Setup the main management window"""
         self.root = tk.Tk()
         self.root.title("Quick Clip Manager")
         self.root.geometry("600x400")
+
         
         # Set proper window closing behavior
         self.root.protocol("WM_DELETE_WINDOW", self.hide_to_tray)
@@ -118,12 +207,8 @@ class QuickClipManager:
         ttk.Button(button_frame, text="Delete", command=self.delete_alias).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Hide", command=self.hide_to_tray).pack(side=tk.LEFT, padx=5)
         
-        # Exit button that forces immediate exit
-        exit_btn = ttk.Button(button_frame, text="Exit")
-        exit_btn.pack(side=tk.LEFT, padx=5)
-        exit_btn.configure(command=lambda: (
-            threading.Thread(target=self.force_exit, daemon=True).start()
-        ))
+        # Exit button shuts down the same way as the tray menu's Exit
+        ttk.Button(button_frame, text="Exit", command=self.quit_application).pack(side=tk.LEFT, padx=5)
 
         # Treeview for aliases
         self.tree = ttk.Treeview(main_frame, columns=('Alias', 'Content'), show='headings')
@@ -143,36 +228,74 @@ class QuickClipManager:
         self.status_label = ttk.Label(main_frame, text="Running in background (Ctrl+F1 to toggle quick input)")
         self.status_label.grid(row=4, column=0, columnspan=2, pady=5)
 
-        # Create quick input window last
-        self.create_quick_input_window()
+        self.create_notification_window()
+
+        # The quick input window is created on first use in show_quick_input
 
     def setup_hotkey(self):
-        """Setup global hotkey in a separate thread"""
-        def hotkey_thread():
-            while self.running:
-                try:
-                    keyboard.wait('ctrl+f1')
-                    if self.running:  # Check if still running
-                        self.root.after(0, self.toggle_quick_input)
-                except Exception as e:
-                    print(f"Hotkey error: {str(e)}")
-                    if not self.running:
-                        break
-
-        self.hotkey_thread = threading.Thread(target=hotkey_thread, daemon=True)
-        self.hotkey_thread.start()
-
-    def quit_application(self, systray=None):
+        """Register the global hotkey"""
+        if sys.platform == 'win32' and self.register_win32_hotkey():
+            return
+        keyboard.add_hotkey('ctrl+f1', self._on_hotkey)
+
+    def register_win32_hotkey(self):
+        """Register Ctrl+F1 with RegisterHotKey, returning True on success
+
+        Windows then only posts WM_HOTKEY for that combination, instead of the
+        keyboard hook waking Python up for every keystroke system-wide.
+        """
+        registered = threading.Event()
+
+        def message_loop():
+            try:
+                from ctypes import wintypes
+                user32 = ctypes.windll.user32
+                # The hotkey is posted to the queue of the thread that registers it
+                if user32.RegisterHotKey(None, HOTKEY_ID, MOD_CONTROL | MOD_NOREPEAT, VK_F1):
+                    self._hotkey_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+            except Exception as e:
+                log.error("Error registering hotkey: %s", e)
+            finally:
+                # Always release setup_hotkey, so it can fall back if needed
+                registered.set()
+            if self._hotkey_thread_id is None:
+                return
+
+            msg = wintypes.MSG()
+            try:
+                while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                        self._on_hotkey()
+            finally:
+                user32.UnregisterHotKey(None, HOTKEY_ID)
+
+        threading.Thread(target=message_loop, daemon=True).start()
+        registered.wait()
+        if self._hotkey_thread_id is None:
+            log.warning("RegisterHotKey failed, falling back to keyboard hook")
+            return False
+        return True
+
+    def _on_hotkey(self):
+        """Called from the hotkey thread when the hotkey is pressed"""
+        try:
+            if self.running:  # Check if still running
+                self.root.after(0, self.toggle_quick_input)
+        except Exception as e:
+            log.error("Hotkey error: %s", e)
+
+    def quit_application(self, icon=None):
         """Properly close the application"""
-        print("Starting application shutdown...")
+        log.info("Starting application shutdown")
         
-        # Force immediate exit without trying to clean up tkinter windows
         try:
-            # Stop hotkey thread
             self.running = False
             
             # Unhook keyboard
             try:
+                if self._hotkey_thread_id is not None:
+                    ctypes.windll.user32.PostThreadMessageW(self._hotkey_thread_id, WM_QUIT, 0, 0)
+                keyboard.remove_all_hotkeys()
                 keyboard.unhook_all()
             except:
                 pass
@@ -180,24 +303,15 @@ class QuickClipManager:
             # Stop tray icon
             try:
                 if self.tray_icon:
-                    self.tray_icon.shutdown()
+                    self.tray_icon.stop()
             except:
                 pass
 
-            # Close database
-            try:
-                if hasattr(self, 'conn'):
-                    self.conn.close()
-            except:
-                pass
+            # Leave the Tk main loop; run() closes the database on its way out
+            self.root.after(0, self.root.quit)
 
         except Exception as e:
-            print(f"Error during shutdown: {str(e)}")
-        
-        print("Forcing immediate exit...")
-        # Force exit without attempting to close windows
-        import os
-        os._exit(0)
+            log.error("Error during shutdown: %s", e)
 
     def minimize_to_tray(self):
         """Minimize the window instead of closing it"""
@@ -260,6 +374,11 @@ class QuickClipManager:
             activestyle='dotbox'
         )
         self.suggestion_listbox.pack(fill='both', expand=True)
+        self._last_display = []
+        self._sugg_width = None
+        self._sugg_height = None
+        self._sugg_geom = None
+        self._sugg_visible = False
 
         # Bind events
         self.suggestion_listbox.bind('<Return>', self.use_suggestion)
@@ -276,97 +395,125 @@ class QuickClipManager:
         self.quick_entry.bind('<Tab>', self.handle_quick_entry_keys)
 
     def update_suggestions(self, event=None):
+        """Schedule a suggestion update, coalescing fast keystrokes"""
+        if self._suggest_job:
+            self.root.after_cancel(self._suggest_job)
+        self._suggest_job = self.root.after(80, self._do_update_suggestions)
+
+    def cancel_suggestion_update(self):
+        """Cancel any pending suggestion update"""
+        if self._suggest_job:
+            self.root.after_cancel(self._suggest_job)
+            self._suggest_job = None
+
+    def _do_update_suggestions(self):
         """Update suggestion list based on current input"""
+        self._suggest_job = None
         try:
             text = self.quick_entry.get().strip()
             
             if text.startswith('/'):
-                search_text = text[1:].lower()
-                if search_text:
-                    # Search for matching aliases using partial match
-                    self.cursor.execute('''
-                        SELECT alias, content FROM aliases 
-                        WHERE LOWER(alias) LIKE ? 
-                        ORDER BY 
-                            CASE 
-                                WHEN LOWER(alias) = ? THEN 0
-                                WHEN LOWER(alias) LIKE ? THEN 1
-                                ELSE 2
-                            END,
-                            LENGTH(alias),
-                            alias
-                        LIMIT 10
-                    ''', (f'%{search_text}%', search_text, f'{search_text}%'))
-                    
-                    matches = self.cursor.fetchall()
-                    print(f"Found matches for '{search_text}': {matches}")  # Debug print
-                    
-                    if matches:
-                        self.show_suggestions(matches)
-                    else:
-                        self.hide_suggestions()
+                needle = text[1:].lower()
+                if needle:
+                    matches = self.rank_aliases(needle, 10)
+                    log.debug("Found matches for %r: %s", needle, matches)
                 else:
                     # If just '/' is typed, show all aliases
-                    self.cursor.execute('''
-                        SELECT alias, content FROM aliases 
-                        ORDER BY alias LIMIT 10
-                    ''')
-                    matches = self.cursor.fetchall()
-                    if matches:
-                        self.show_suggestions(matches)
-                    else:
-                        self.hide_suggestions()
+                    matches = self._top10
+
+                if matches:
+                    self.show_suggestions(matches)
+                else:
+                    self.hide_suggestions()
             else:
                 self.hide_suggestions()
                 
         except Exception as e:
-            print(f"Error updating suggestions: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error updating suggestions: %s", e)
+
+    def rank_aliases(self, needle, limit):
+        """Return the best (alias, content) matches for a lowercase needle
+
+        Shared by the dropdown and Enter so both always agree on the top match.
+        """
+        # Filter the cached aliases using partial match against the
+        # precomputed lowercase alias, then keep the best ranked
+        hits = [row for row in self._alias_cache if needle in row[2]]
+        best = heapq.nsmallest(limit, hits, key=lambda row: (
+            row[2] != needle,
+            not row[2].startswith(needle),
+            len(row[0]),
+            row[2],
+            row[0]
+        ))
+        return [(alias, content) for alias, content, _ in best]
 
     def show_suggestions(self, matches):
         """Show suggestion window with matches"""
         try:
-            self.suggestion_listbox.delete(0, tk.END)
             self.current_suggestions = []
+            display_texts = []
             
             max_alias_length = max(len(alias) for alias, _ in matches)
             
             for alias, content in matches:
                 # Format the display text with aligned columns
                 display_text = f"{alias.ljust(max_alias_length + 2)} | {content[:50]}{'...' if len(content) > 50 else ''}"
-                self.suggestion_listbox.insert(tk.END, display_text)
+                display_texts.append(display_text)
                 self.current_suggestions.append((alias, content))
 
+            # Only touch the rows that changed since the last update
+            old_texts = self._last_display
+            if display_texts != old_texts:
+                # A full rebuild used to drop the selection; keep doing so
+                self.suggestion_listbox.selection_clear(0, tk.END)
+            common = min(len(old_texts), len(display_texts))
+            for i in range(common):
+                if old_texts[i] != display_texts[i]:
+                    self.suggestion_listbox.delete(i)
+                    self.suggestion_listbox.insert(i, display_texts[i])
+            if len(old_texts) > common:
+                self.suggestion_listbox.delete(common, tk.END)
+            if len(display_texts) > common:
+                self.suggestion_listbox.insert(tk.END, *display_texts[common:])
+            self._last_display = display_texts
+
             # Adjust listbox width based on content
-            max_width = max(len(text) for text in self.suggestion_listbox.get(0, tk.END))
-            self.suggestion_listbox.configure(width=max_width)
+            max_width = max(map(len, display_texts))
+            if max_width != self._sugg_width:
+                self.suggestion_listbox.configure(width=max_width)
+                self._sugg_width = max_width
+
+            height = min(len(matches), 10)
+            if height != self._sugg_height:
+                self.suggestion_listbox.configure(height=height)
+                self._sugg_height = height
 
             # Position suggestion window below quick input
             x = self.quick_window.winfo_x()
             y = self.quick_window.winfo_y() + self.quick_window.winfo_height()
-            
-            # Calculate required height based on number of items
-            item_height = self.suggestion_listbox.winfo_reqheight() // max(len(matches), 1)
-            height = min(len(matches) * item_height + 4, 200)  # Max height of 200 pixels
-            
-            self.suggestion_window.geometry(f"+{x}+{y}")
-            self.suggestion_listbox.configure(height=min(len(matches), 10))
-            
-            self.suggestion_window.deiconify()
-            self.suggestion_window.lift()
+            geom = f"+{x}+{y}"
+            if geom != self._sugg_geom:
+                self.suggestion_window.geometry(geom)
+                self._sugg_geom = geom
+
+            if not self._sugg_visible:
+                self.suggestion_window.deiconify()
+                self.suggestion_window.lift()
+                self._sugg_visible = True
             
         except Exception as e:
-            print(f"Error showing suggestions: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error showing suggestions: %s", e)
 
     def hide_suggestions(self):
         """Hide the suggestion window"""
         try:
             if self.suggestion_window:
                 self.suggestion_window.withdraw()
+            self._sugg_visible = False
             self.current_suggestions = []
         except Exception as e:
-            print(f"Error hiding suggestions: {str(e)}")
+            log.error("Error hiding suggestions: %s", e)
 
     def focus_suggestions(self, event):
         """Move focus to suggestion list"""
@@ -438,13 +585,12 @@ class QuickClipManager:
                 index = self.suggestion_listbox.curselection()[0]
                 if 0 <= index < len(self.current_suggestions):
                     alias, content = self.current_suggestions[index]
-                    print(f"Using suggestion: {alias} with content: {content}")  # Debug print
+                    log.debug("Using suggestion: %s with content: %s", alias, content)
                     pyperclip.copy(content)
                     self.hide_quick_input()
                     self.show_notification(f"Copied: {alias}")
         except Exception as e:
-            print(f"Error using suggestion: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error using suggestion: %s", e)
 
     def show_quick_input(self):
         """Show the quick input window at the center of the screen"""
@@ -452,18 +598,9 @@ class QuickClipManager:
             if not self.quick_window:
                 self.create_quick_input_window()
                 
-            # Get screen dimensions
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            window_width = 250
-            window_height = 35
-            
-            # Calculate position
-            x = (screen_width - window_width) // 2
-            y = (screen_height - window_height) // 2
-            
             # Configure window
-            self.quick_window.geometry(f'{window_width}x{window_height}+{x}+{y}')
+            *_, geometry = self.quick_input_geometry()
+            self.quick_window.geometry(geometry)
             self.quick_entry.delete(0, tk.END)
             
             # Show window
@@ -475,20 +612,41 @@ class QuickClipManager:
             self.is_quick_window_visible = True
             
         except Exception as e:
-            print(f"Error showing quick input: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error showing quick input: %s", e)
+
+    def quick_input_geometry(self):
+        """Return (width, height, x, y, geometry) centering the quick input
+
+        The screen size is read on every call so a resolution or DPI change
+        is always picked up; the geometry is only rebuilt when it changed.
+        """
+        # Get screen dimensions
+        screen_w = self.root.winfo_screenwidth()
+        screen_h = self.root.winfo_screenheight()
+        if self._quick_geom is None or (screen_w, screen_h) != (self._screen_w, self._screen_h):
+            self._screen_w, self._screen_h = screen_w, screen_h
+            window_width = 250
+            window_height = 35
+            
+            # Calculate position
+            x = (screen_w - window_width) // 2
+            y = (screen_h - window_height) // 2
+            geometry = f'{window_width}x{window_height}+{x}+{y}'
+            self._quick_geom = (window_width, window_height, x, y, geometry)
+        return self._quick_geom
 
     def hide_quick_input(self):
         """Hide the quick input window"""
         try:
+            self.cancel_suggestion_update()
             if self.quick_window:
                 self.quick_window.withdraw()
             if self.suggestion_window:
                 self.suggestion_window.withdraw()
+            self._sugg_visible = False
             self.is_quick_window_visible = False
         except Exception as e:
-            print(f"Error hiding quick input: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error hiding quick input: %s", e)
 
     def toggle_quick_input(self):
         """Toggle the quick input window visibility"""
@@ -498,8 +656,7 @@ class QuickClipManager:
             else:
                 self.show_quick_input()
         except Exception as e:
-            print(f"Error toggling quick input: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error toggling quick input: %s", e)
 
     def process_quick_input(self, event):
         """Process the quick input when Enter is pressed"""
@@ -507,79 +664,80 @@ class QuickClipManager:
             text = self.quick_entry.get().strip()
             if text.startswith('/'):
                 search_text = text[1:].lower()
-                print(f"Processing input: {search_text}")  # Debug print
+                log.debug("Processing input: %s", search_text)
                 
-                try:
-                    # First try exact match
-                    self.cursor.execute('''
-                        SELECT content FROM aliases 
-                        WHERE LOWER(alias) = ? COLLATE NOCASE
-                    ''', (search_text,))
-                    result = self.cursor.fetchone()
-                    
-                    if not result:
-                        # If no exact match, try partial match
-                        self.cursor.execute('''
-                            SELECT content FROM aliases 
-                            WHERE LOWER(alias) LIKE ? COLLATE NOCASE
-                            ORDER BY LENGTH(alias), alias LIMIT 1
-                        ''', (f'%{search_text}%',))
-                        result = self.cursor.fetchone()
-                    
-                    print(f"Search result: {result}")  # Debug print
+                # Exact, then prefix, then shortest partial match; the same
+                # ranking as the first row of the suggestion dropdown
+                result = self.rank_aliases(search_text, 1)
+                log.debug("Search result: %s", result)
+                
+                if result:
+                    content = result[0][1]
+                    log.debug("Copying content: %s", content)
                     
-                    if result:
-                        content = result[0]
-                        print(f"Copying content: {content}")  # Debug print
-                        
-                        # Try copying with error handling
-                        try:
-                            pyperclip.copy(content)
-                            print("Content copied successfully")
-                            self.hide_quick_input()
-                            self.show_notification(f"Copied content to clipboard")
-                        except Exception as e:
-                            print(f"Clipboard error: {str(e)}")
-                            self.show_notification(f"Error copying to clipboard: {str(e)}")
-                    else:
-                        print(f"No match found for: {search_text}")
-                        self.show_notification(f"No match found for: {search_text}")
-                        
-                except sqlite3.Error as e:
-                    print(f"Database error: {str(e)}")
-                    self.show_notification(f"Database error: {str(e)}")
+                    # Try copying with error handling
+                    try:
+                        pyperclip.copy(content)
+                        log.debug("Content copied successfully")
+                        self.hide_quick_input()
+                        self.show_notification(f"Copied content to clipboard")
+                    except Exception as e:
+                        log.error("Clipboard error: %s", e)
+                        self.show_notification(f"Error copying to clipboard: {str(e)}")
+                else:
+                    log.debug("No match found for: %s", search_text)
+                    self.show_notification(f"No match found for: {search_text}")
             
             self.quick_entry.delete(0, tk.END)
             
         except Exception as e:
-            print(f"Error in process_quick_input: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error in process_quick_input: %s", e)
             self.show_notification(f"Error: {str(e)}")
 
+    def create_notification_window(self):
+        """Create the hidden notification window reused by show_notification"""
+        self._notif_win = tk.Toplevel(self.root)
+        self._notif_win.attributes('-topmost', True)
+        self._notif_win.overrideredirect(True)
+
+        # Create a frame with a border
+        frame = ttk.Frame(self._notif_win, relief='solid', borderwidth=1)
+        frame.pack(fill='both', expand=True)
+
+        self._notif_label = ttk.Label(frame, padding=5)
+        self._notif_label.pack()
+
+        self._notif_win.withdraw()
+        self._notif_job = None
+
     def show_notification(self, message):
         """Show a temporary notification"""
         try:
-            notification = tk.Toplevel(self.root)
-            notification.attributes('-topmost', True)
-            notification.overrideredirect(True)
-            
+            self._notif_label.configure(text=message)
+
             # Position near the quick input window
-            x = self.quick_window.winfo_x()
-            y = self.quick_window.winfo_y() + self.quick_window.winfo_height() + 5
-            
-            notification.geometry(f"+{x}+{y}")
-            
-            # Create a frame with a border
-            frame = ttk.Frame(notification, relief='solid', borderwidth=1)
-            frame.pack(fill='both', expand=True)
+            if self.quick_window:
+                x = self.quick_window.winfo_x()
+                y = self.quick_window.winfo_y() + self.quick_window.winfo_height() + 5
+            else:
+                # Not created yet, use where it will appear
+                _, window_height, x, y, _ = self.quick_input_geometry()
+                y += window_height + 5
             
-            label = ttk.Label(frame, text=message, padding=5)
-            label.pack()
+            self._notif_win.geometry(f"+{x}+{y}")
+            self._notif_win.deiconify()
             
-            # Auto-close after 2 seconds
-            self.root.after(2000, notification.destroy)
+            # Auto-hide after 2 seconds, restarting the timer for a new message
+            if self._notif_job:
+                self.root.after_cancel(self._notif_job)
+            self._notif_job = self.root.after(2000, self.hide_notification)
         except Exception as e:
-            print(f"Error showing notification: {str(e)}")
+            log.error("Error showing notification: %s", e)
+
+    def hide_notification(self):
+        """Hide the notification window"""
+        self._notif_job = None
+        self._notif_win.withdraw()
 
     def save_alias(self):
         """Save or update an alias"""
@@ -591,28 +749,26 @@ class QuickClipManager:
                 messagebox.showwarning("Warning", "Both alias and content are required!")
                 return
 
-            print(f"Saving alias: {alias} with content: {content}")
+            log.debug("Saving alias: %s with content: %s", alias, content)
             
-            self.cursor.execute('''
-                INSERT INTO aliases (alias, content) VALUES (?, ?)
-                ON CONFLICT(alias) DO UPDATE SET 
-                    content = excluded.content,
-                    updated_at = CURRENT_TIMESTAMP
-            ''', (alias, content))
-            self.conn.commit()
-            print("Alias saved successfully")
+            self.save_aliases_bulk([(alias, content)])
+            log.debug("Alias saved successfully")
             
             self.load_aliases()
             self.clear_inputs()
             messagebox.showinfo("Success", "Alias saved successfully!")
         except sqlite3.Error as e:
-            print(f"Database error while saving: {str(e)}")
+            log.error("Database error while saving: %s", e)
             messagebox.showerror("Error", f"Failed to save alias: {str(e)}")
         except Exception as e:
-            print(f"Error while saving: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Error while saving: %s", e)
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
 
+    def save_aliases_bulk(self, pairs):
+        """Insert or update many (alias, content) pairs in one transaction"""
+        with self._conn() as conn:
+            conn.executemany(SQL_UPSERT, pairs)
+
     def delete_alias(self):
         """Delete selected alias"""
         selection = self.tree.selection()
@@ -622,19 +778,27 @@ class QuickClipManager:
         
         alias = self.tree.item(selection[0])['values'][0]
         if messagebox.askyesno("Confirm", f"Delete alias '{alias}'?"):
-            self.cursor.execute('DELETE FROM aliases WHERE alias = ?', (alias,))
-            self.conn.commit()
+            with self._conn() as conn:
+                conn.execute('DELETE FROM aliases WHERE alias = ?', (alias,))
             self.load_aliases()
             self.clear_inputs()
 
     def load_aliases(self):
-        """Load aliases into the treeview"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        self.cursor.execute('SELECT alias, content FROM aliases ORDER BY alias')
-        for row in self.cursor.fetchall():
+        """Load aliases into the treeview and refresh the in-memory cache"""
+        with self._conn() as conn:
+            rows = conn.execute(SQL_ALL).fetchall()
+        self._alias_cache = [(alias, content, alias.lower()) for alias, content in rows]
+        # rows are already ordered by alias
+        self._top10 = rows[:10]
+
+        # Take the tree off screen while rebuilding so it is laid out once
+        self.tree.grid_remove()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        for row in rows:
             self.tree.insert('', tk.END, values=row)
+        self.tree.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
 
     def on_select(self, event):
         """Handle treeview selection"""
@@ -652,9 +816,8 @@ class QuickClipManager:
         self.content_text.delete("1.0", tk.END)
 
     def force_exit(self):
-        """Force exit the application from a separate thread"""
-        print("Force exit initiated...")
-        import os
+        """Force exit the application once the main loop has ended"""
+        log.info("Force exit initiated")
         os._exit(0)
 
     def run(self):
@@ -664,11 +827,23 @@ class QuickClipManager:
             self.show_notification("Quick Clip Manager is running")
             self.root.mainloop()
         except Exception as e:
-            print(f"Error in main loop: {str(e)}")
+            log.error("Error in main loop: %s", e)
         finally:
-            # Force immediate exit
+            # Close database
+            try:
+                conn = getattr(self._tls, 'conn', None)
+                if conn is not None:
+                    conn.close()
+            except:
+                pass
+            # Force immediate exit in case a library thread is still alive
             self.force_exit()
 
 if __name__ == "__main__":
+    # Set QCM_DEBUG=1 to see debug logging
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get('QCM_DEBUG') else logging.WARNING,
+        format='%(asctime)s %(levelname)s %(message)s'
+    )
     app = QuickClipManager()
     app.run() 
\ No newline at end of file